@@ -0,0 +1,259 @@
+import argparse
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections import defaultdict
+
+from storage import load_csv
+
+MAGIC = b"TARC"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sII")  # magic, version, header length
+TYPECODES = {"int": "i", "str": "I"}  # int32 values, uint32 codes into the name table
+INT_FIELDS = {"teams": ["points"], "matches": ["points1", "points2"]}  # everything else is a str column
+
+
+#layout: preamble | JSON header | padding | one little-endian block per column
+#header: {"strings": [...], "tables": {table: {"rows": n, "columns": {name: {"type", "offset"}}}}}
+
+def _int_values(table, name, rows):
+    values = array("i")
+    for i, row in enumerate(rows):
+        try:
+            values.append(int(row[name]))
+        except (ValueError, TypeError, OverflowError):
+            raise ValueError(f"{table} row {i + 1}: {name} must be a number, got {row[name]!r}")
+    return values
+
+def _encode_table(table, rows, strings, string_index):
+    columns = {}
+    for name in (rows[0] if rows else {}):
+        if name in INT_FIELDS[table]:
+            kind = "int"
+            values = _int_values(table, name, rows)
+        else:
+            kind = "str"
+            values = array("I")
+            for row in rows:
+                # intern every name, sport, status, ... once per archive
+                value = str(row[name])
+                if value not in string_index:
+                    string_index[value] = len(strings)
+                    strings.append(value)
+                values.append(string_index[value])
+        if sys.byteorder != "little":
+            values.byteswap()
+        columns[name] = (kind, values)
+    return columns
+
+def freeze(filename, teams, matches, force=False):
+    """Write teams (or players) and matches of a finished tournament to a columnar archive.
+
+    Raises ValueError if a match is not finished yet, unless force is set.
+    """
+    unfinished = [m for m in matches if m["status"] != "Finished"]
+    if unfinished and not force:
+        raise ValueError(f"{len(unfinished)} matches are not finished yet (--force archives anyway)")
+
+    strings, string_index = [], {}
+    tables = {"teams": teams, "matches": matches}
+    encoded = {table: _encode_table(table, rows, strings, string_index) for table, rows in tables.items()}
+
+    # offsets are part of the header, so move the data start until the header fits in front of it
+    def layout(offset):
+        header = {"strings": strings, "tables": {}}
+        blocks = []
+        for table, columns in encoded.items():
+            header["tables"][table] = {"rows": len(tables[table]), "columns": {}}
+            for name, (kind, values) in columns.items():
+                offset += -offset % 8
+                header["tables"][table]["columns"][name] = {"type": kind, "offset": offset}
+                blocks.append((offset, values))
+                offset += len(values) * values.itemsize
+        return header, blocks
+
+    data_start = 0
+    while True:
+        header, blocks = layout(data_start)
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        needed = PREAMBLE.size + len(header_bytes)
+        needed += -needed % 8
+        if needed <= data_start:
+            break
+        data_start = needed
+
+    with open(filename, "wb") as file:
+        file.write(PREAMBLE.pack(MAGIC, VERSION, len(header_bytes)))
+        file.write(header_bytes)
+        for offset, values in blocks:
+            file.write(b"\0" * (offset - file.tell()))
+            values.tofile(file)
+
+class Archive:
+    """Read-only, memory-mapped view of a frozen tournament.
+
+    Columns are returned as memoryviews into the mapping, so only the pages
+    of the columns that are actually read get loaded. Release them (or use
+    them in a with block) before closing the archive.
+    """
+
+    def __init__(self, filename):
+        self._mmap = None
+        self._file = open(filename, "rb")
+        try:
+            # an empty file can't be mapped and raises ValueError as well
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            size = len(self._mmap)
+            if size < PREAMBLE.size:
+                raise ValueError("file is too short")
+            magic, version, header_length = PREAMBLE.unpack_from(self._mmap)
+            if magic != MAGIC or version != VERSION or PREAMBLE.size + header_length > size:
+                raise ValueError("bad preamble")
+            header = json.loads(self._mmap[PREAMBLE.size:PREAMBLE.size + header_length].decode("utf-8"))
+            self.strings = header["strings"]
+            self.tables = header["tables"]
+            for table in self.tables.values():
+                for info in table["columns"].values():
+                    if info["offset"] + table["rows"] * struct.calcsize(TYPECODES[info["type"]]) > size:
+                        raise ValueError("column past the end of the file")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.close()
+            raise ValueError(f"{filename} is not a tournament archive (version {VERSION})") from e
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def has_column(self, table, name):
+        return name in self.tables[table]["columns"]
+
+    def column(self, table, name):
+        info = self.tables[table]["columns"][name]
+        typecode = TYPECODES[info["type"]]
+        size = self.tables[table]["rows"] * struct.calcsize(typecode)
+        view = memoryview(self._mmap)[info["offset"]:info["offset"] + size]
+        if sys.byteorder != "little":
+            values = array(typecode, view)
+            values.byteswap()
+            view.release()
+            return memoryview(values)
+        return view.cast(typecode)
+
+    def values(self, table, name):
+        with self.column(table, name) as column:
+            if self.tables[table]["columns"][name]["type"] == "int":
+                return column.tolist()
+            return [self.strings[code] for code in column]
+
+    def rows(self, table):
+        # back to the dicts the CSV loaders return, e.g. for set_points
+        names = list(self.tables[table]["columns"])
+        columns = [self.values(table, name) for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+def score(teams, matches):
+    """Recompute the points of teams from matches with the scoring of the script that wrote them."""
+    if not matches:
+        for team in teams:
+            team["points"] = 0
+        return teams
+    if "bracket" in matches[0]:
+        from tournament import set_points
+        return set_points(teams, matches)
+    if "bracket_stage" in matches[0]:
+        from brackets import calculate_bracket_points
+        return calculate_bracket_points(teams, matches)
+    from singles import calculate_points
+    return calculate_points(teams, matches)
+
+def _sides(archive):
+    if archive.has_column("matches", "team1"):
+        return ["team1"], ["team2"]
+    return ["team1player1", "team1player2"], ["team2player1", "team2player2"]
+
+def season_standings(filenames):
+    # re-scored from the archived matches, the stored points column may be stale
+    standings = defaultdict(int)
+    for filename in filenames:
+        with Archive(filename) as archive:
+            if not archive.tables["matches"]["rows"]:
+                continue
+            names = archive.values("teams", "name") if archive.tables["teams"]["rows"] else []
+            for column in sum(_sides(archive), []):
+                names += archive.values("matches", column)
+            teams = [{"name": name, "points": 0} for name in dict.fromkeys(names)]
+            for team in score(teams, archive.rows("matches")):
+                standings[team["name"]] += team["points"]
+    return dict(standings)
+
+def win_counts(filenames):
+    wins = defaultdict(int)
+    for filename in filenames:
+        with Archive(filename) as archive:
+            if not archive.tables["matches"]["rows"]:
+                continue
+            sides = _sides(archive)
+            bracket_schema = sides[0] == ["team1"]
+            finished = archive.strings.index("Finished") if "Finished" in archive.strings else -1
+
+            with archive.column("matches", "status") as status, \
+                    archive.column("matches", "points1") as points1, \
+                    archive.column("matches", "points2") as points2:
+                # brackets give a draw to team2 like set_points, the league scores it as no win
+                played = [i for i in range(len(status))
+                          if status[i] == finished and (bracket_schema or points1[i] != points2[i])]
+                side1_won = {i: points1[i] > points2[i] for i in played}
+
+            for side, columns in enumerate(sides):
+                for name in columns:
+                    with archive.column("matches", name) as players:
+                        for i in played:
+                            if side1_won[i] == (side == 0):
+                                wins[archive.strings[players[i]]] += 1
+    return dict(wins)
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="🗄️ Tournament archive")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    freeze_parser = subparsers.add_parser("freeze", help="Archive the current CSVs")
+    freeze_parser.add_argument("output", help="Archive file to write")
+    freeze_parser.add_argument("--players", action="store_true", help="Archive players.csv instead of teams.csv")
+    freeze_parser.add_argument("--force", action="store_true", help="Archive even if some matches are not finished")
+    stats_parser = subparsers.add_parser("stats", help="Season statistics over archives")
+    stats_parser.add_argument("archives", nargs="+", help="Archive files")
+    args = parser.parse_args(argv)
+
+    if args.command == "freeze":
+        teams = load_csv("players.csv" if args.players else "teams.csv", ["points"])
+        matches = load_csv("matches.csv", ["points1", "points2"])
+        try:
+            freeze(args.output, score(teams, matches), matches, force=args.force)
+        except ValueError as e:
+            print(f"❌ {e}, nothing archived.")
+            return
+        print(f"🗄️ Archived {len(teams)} teams and {len(matches)} matches to {args.output}")
+        return
+
+    try:
+        standings = season_standings(args.archives)
+        wins = win_counts(args.archives)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return
+    print(f"\n🏅 Season standings ({len(args.archives)} tournaments)")
+    names = set(standings) | set(wins)
+    for name in sorted(names, key=lambda n: (-standings.get(n, 0), -wins.get(n, 0))):
+        print(f"  {name:<12} {standings.get(name, 0):>4} Points  {wins.get(name, 0):>3} Wins")
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,19 @@
-import csv
 import argparse
-import os
-import subprocess
 from collections import defaultdict
 
+from storage import load_csv, save_csv
+
 def load_teams(filename="teams.csv"):
-    teams = []
-    if os.path.exists(filename):
-        with open(filename) as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                row["points"] = int(row["points"])
-                teams.append(row)
-    return teams
+    return load_csv(filename, ["points"])
 
 def load_matches(filename="matches.csv"):
-    matches = []
-    if os.path.exists(filename):
-        with open(filename) as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                row["points1"] = int(row["points1"])
-                row["points2"] = int(row["points2"])
-                matches.append(row)
-    return matches
+    return load_csv(filename, ["points1", "points2"])
 
 def save_teams_to_csv(teams, filename="teams.csv"):
-    with open(filename, "w", newline="") as file:
-        writer = csv.DictWriter(file, fieldnames=["color", "name", "points"])
-        writer.writeheader()
-        for team in teams:
-            writer.writerow(team)
+    save_csv(teams, filename, ["color", "name", "points"])
 
 def save_matches_to_csv(matches, filename="matches.csv"):
-    with open(filename, "w", newline="") as file:
-        writer = csv.DictWriter(file, fieldnames=["team1", "team2", "sport", "status", "bracket_stage", "points1", "points2"])
-        writer.writeheader()
-        for match in matches:
-            writer.writerow(match)
+    save_csv(matches, filename, ["team1", "team2", "sport", "status", "bracket_stage", "points1", "points2"])
 
 def get_team_index(teams, name):
     for i, team in enumerate(teams):
@@ -61,14 +37,20 @@ def add_match(matches, team1, team2, sport, bracket_stage, status="Scheduled", p
     })
     return matches
 
-def update_match_score(matches):
+def list_unfinished_matches(matches):
     unfinished = [m for m in matches if m["status"] != "Finished"]
     if not unfinished:
         print("✅ All matches are finished.")
-        return matches
+        return unfinished
 
     for idx, match in enumerate(unfinished):
         print(f"[{idx}] {match['team1']} vs {match['team2']} ({match['sport']}, {match['bracket_stage']}) - {match['status']}")
+    return unfinished
+
+def update_match_score(matches):
+    unfinished = list_unfinished_matches(matches)
+    if not unfinished:
+        return matches
 
     try:
         choice = int(input("Select match to update score: "))
@@ -82,6 +64,8 @@ def update_match_score(matches):
     return matches
 
 def calculate_bracket_points(teams, matches):
+    for team in teams:
+        team["points"] = 0
     sports = defaultdict(list)
     for match in matches:
         sports[match["sport"]].append(match)
@@ -191,20 +175,39 @@ def write_md(teams, matches, output_file="index.md"):
             score = f"{m['points1']} - {m['points2']}" if m["status"] == "Finished" else "-"
             f.write(f"| {m['team1']} vs {m['team2']} | {m['sport']} | {m['status']} | {score} |\n")
 
-def main():
-    parser = argparse.ArgumentParser(description="🏆 Multi-Sport Bracket Tournament")
+def watch_and_rebuild(teams_file="teams.csv", matches_file="matches.csv", output_file="index.md"):
+    from watcher import watch_and_render
+
+    def render(data):
+        teams = calculate_bracket_points(data[teams_file], data[matches_file])
+        write_md(teams, data[matches_file], output_file)
+
+    return watch_and_render({teams_file: load_teams, matches_file: load_matches}, render)
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="🏆 Multi-Sport Bracket Tournament")
     parser.add_argument("--add-team", action="store_true", help="Add a new team")
     parser.add_argument("--add-match", action="store_true", help="Add a bracket match")
     parser.add_argument("--update-score", action="store_true", help="Update match scores")
     parser.add_argument("--rebuild", action="store_true", help="Recalculate points and rebuild site")
+    parser.add_argument("--watch", action="store_true", help="Rebuild the site whenever the CSVs change")
+    parser.add_argument("--list", action="store_true", help="List unfinished matches")
+
+    args = parser.parse_args(argv)
 
-    args = parser.parse_args()
+    if args.list:
+        list_unfinished_matches(load_matches())
+        return
 
-    if not os.path.exists("teams.csv"):
-        save_teams_to_csv([])
-    if not os.path.exists("matches.csv"):
-        save_matches_to_csv([])
+    changes = any([args.add_team, args.add_match, args.update_score, args.rebuild])
+    if not changes:
+        if args.watch:
+            watch_and_rebuild()
+        else:
+            parser.print_help()
+        return
 
+    # Missing CSVs load as empty and get created on save
     teams = load_teams()
     matches = load_matches()
 
@@ -230,6 +233,8 @@ def main():
         save_matches_to_csv(matches)
         write_md(teams, matches)
 
+        import subprocess
+
         subprocess.run(["git", "add", "."], check=True)
         subprocess.run(["git", "commit", "-m", "🏁 Tournament update"], check=True)
         subprocess.run(["git", "push"], check=True)
@@ -239,5 +244,8 @@ def main():
         save_matches_to_csv(matches)
         write_md(teams, matches)
 
+    if args.watch:
+        watch_and_rebuild()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,50 @@
+import time
+
+STARTED = time.perf_counter()
+
+import argparse
+import importlib
+import sys
+
+#measured from the first line of cli.py to the imported subcommand, interpreter start-up not included
+DISPATCH_BUDGET_MS = 50
+BUDGET_EXEMPT = {"odds"}  # importing NumPy alone takes ~100 ms
+
+#subcommand: (module, help), the module is only imported when its subcommand runs
+COMMANDS = {
+    "team": ("tournament", "Team tournament with Semis/Finals/Losers per sport"),
+    "bracket": ("brackets", "Multi-sport bracket tournament"),
+    "singles": ("singles", "Player tournament with mixed doubles"),
+    "generate": ("generator", "Generate balanced matchups"),
+    "odds": ("projections", "Monte Carlo placement projections"),
+    "archive": ("archive", "Freeze finished tournaments and query archived seasons"),
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="🏆 Tournament CLI",
+        epilog="Run '<command> --help' for the options of a command.",
+    )
+    parser.add_argument("--dispatch-time", action="store_true", help=f"Report the dispatch time against the {DISPATCH_BUDGET_MS} ms budget")
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="command")
+    for name, (_, help_text) in COMMANDS.items():
+        # the subcommand parses its own options (including --help)
+        subparsers.add_parser(name, help=help_text, add_help=False)
+
+    args, command_args = parser.parse_known_args(argv)
+    try:
+        module = importlib.import_module(COMMANDS[args.command][0])
+    except ModuleNotFoundError as e:
+        # e.g. NumPy for odds, see requirements.txt
+        parser.exit(1, f"❌ '{args.command}' needs the {e.name} package: pip install -r requirements.txt\n")
+
+    dispatch_ms = (time.perf_counter() - STARTED) * 1000
+    over_budget = dispatch_ms > DISPATCH_BUDGET_MS and args.command not in BUDGET_EXEMPT
+    if args.dispatch_time or over_budget:
+        status = "⚠️ over budget" if over_budget else "✅"
+        print(f"⏱️ dispatch: {dispatch_ms:.1f} ms (budget {DISPATCH_BUDGET_MS} ms) {status}", file=sys.stderr)
+
+    module.main(command_args, prog=f"{parser.prog} {args.command}")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import random
 from itertools import combinations
 
@@ -27,7 +28,10 @@ def generate_balanced_matchups(num_teams, games_per_team):
     return scheduled_matches
 
 
-def main():
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="🎯 Match Generator for Equal Play Time")
+    parser.parse_args(argv)
+
     print("🎯 Match Generator for Equal Play Time")
     try:
         num_teams = int(input("Enter number of teams: "))
@@ -0,0 +1,326 @@
+import argparse
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+BRACKET_POINTS = {"first": 3, "second": 2, "third": 1}
+
+
+#strength: (wins + 1) / (games + 2), so teams without results start at 0.5
+#win probability of a over b: strength[a] / (strength[a] + strength[b])
+
+def estimate_strengths(results, names):
+    wins = defaultdict(float)
+    games = defaultdict(int)
+    for winners, losers, draw in results:
+        for name in winners + losers:
+            games[name] += 1
+        for name in winners:
+            wins[name] += 0.5 if draw else 1
+        if draw:
+            for name in losers:
+                wins[name] += 0.5
+    return np.array([(wins[n] + 1) / (games[n] + 2) for n in names])
+
+def win_matrix(strengths):
+    total = strengths[:, None] + strengths[None, :]
+    return strengths[:, None] / total
+
+def _name_index(names, matches, keys):
+    names = list(names)
+    for match in matches:
+        for key in keys:
+            if match[key] not in names:
+                names.append(match[key])
+    return names, {name: i for i, name in enumerate(names)}
+
+def _outcome(match):
+    # same tie rule as set_points: team2 wins unless team1 scored more
+    if match["points1"] > match["points2"]:
+        return match["team1"], match["team2"]
+    return match["team2"], match["team1"]
+
+def _fixed_result(match, index):
+    if match["status"] != "Finished":
+        return None
+    winner, loser = _outcome(match)
+    return index[winner], index[loser]
+
+def build_bracket_model(teams, matches, stage_key="bracket"):
+    names, index = _name_index([t["name"] for t in teams], matches, ["team1", "team2"])
+
+    results = []
+    for m in matches:
+        if m["status"] == "Finished":
+            winner, loser = _outcome(m)
+            results.append(([winner], [loser], False))
+    p = win_matrix(estimate_strengths(results, names))
+
+    sports = defaultdict(list)
+    for m in matches:
+        sports[m["sport"]].append(m)
+
+    brackets = []
+    for sport, sport_matches in sports.items():
+        semis = [m for m in sport_matches if m[stage_key] == "Semis"]
+        if len(semis) != 2:
+            continue
+
+        finals = [m for m in sport_matches if m[stage_key] == "Finals" and m["status"] == "Finished"]
+        losers = [m for m in sport_matches if m[stage_key] == "Losers" and m["status"] == "Finished"]
+
+        # the Finals/Losers pairings follow from the (simulated) semis until they are played
+        brackets.append({
+            "sport": sport,
+            "semis": [(index[m["team1"]], index[m["team2"]], _fixed_result(m, index)) for m in semis],
+            "final": _fixed_result(finals[0], index) if finals else None,
+            "losers": _fixed_result(losers[0], index) if losers else None,
+        })
+
+    return {"kind": "bracket", "names": names, "p": p, "brackets": brackets,
+            "sports": [b["sport"] for b in brackets]}
+
+def build_league_model(players, matches):
+    keys = ["team1player1", "team1player2", "team2player1", "team2player2"]
+    names, index = _name_index([p["name"] for p in players], matches, keys)
+
+    results = []
+    for m in matches:
+        if m["status"] != "Finished":
+            continue
+        side1 = [m["team1player1"], m["team1player2"]]
+        side2 = [m["team2player1"], m["team2player2"]]
+        if m["points2"] > m["points1"]:
+            side1, side2 = side2, side1
+        results.append((side1, side2, m["points1"] == m["points2"]))
+    strengths = estimate_strengths(results, names)
+    draws = sum(1 for r in results if r[2])
+    draw_rate = (draws + 0.5) / (len(results) + 5)
+
+    sports = sorted({m["sport"] for m in matches})
+    sport_index = {sport: i for i, sport in enumerate(sports)}
+    fixed_points = np.zeros((len(sports), len(names)))
+    remaining = []
+    for m in matches:
+        s = sport_index[m["sport"]]
+        side1 = [index[m["team1player1"]], index[m["team1player2"]]]
+        side2 = [index[m["team2player1"]], index[m["team2player2"]]]
+        if m["status"] == "Finished":
+            # same 3/1/0 scoring as calculate_points
+            if m["points1"] > m["points2"]:
+                fixed_points[s, side1] += 3
+            elif m["points2"] > m["points1"]:
+                fixed_points[s, side2] += 3
+            else:
+                fixed_points[s, side1 + side2] += 1
+        else:
+            s1 = strengths[side1].mean()
+            s2 = strengths[side2].mean()
+            remaining.append((s, side1, side2, s1 / (s1 + s2)))
+
+    return {"kind": "league", "names": names, "sports": sports, "draw_rate": draw_rate,
+            "fixed_points": fixed_points, "remaining": remaining}
+
+def _play(rng, p, a, b, n):
+    a = np.broadcast_to(a, (n,))
+    b = np.broadcast_to(b, (n,))
+    team1_wins = rng.random(n) < p[a, b]
+    return np.where(team1_wins, a, b), np.where(team1_wins, b, a)
+
+def _simulate_brackets(model, n, rng):
+    p = model["p"]
+    rows = np.arange(n)
+    points = np.zeros((len(model["brackets"]), n, len(model["names"])))
+    for s, bracket in enumerate(model["brackets"]):
+        semi_winners, semi_losers = [], []
+        for a, b, result in bracket["semis"]:
+            if result is None:
+                winner, loser = _play(rng, p, a, b, n)
+            else:
+                winner, loser = np.full(n, result[0]), np.full(n, result[1])
+            semi_winners.append(winner)
+            semi_losers.append(loser)
+
+        if bracket["final"] is None:
+            first, second = _play(rng, p, semi_winners[0], semi_winners[1], n)
+        else:
+            first, second = np.full(n, bracket["final"][0]), np.full(n, bracket["final"][1])
+        if bracket["losers"] is None:
+            third, _ = _play(rng, p, semi_losers[0], semi_losers[1], n)
+        else:
+            third = np.full(n, bracket["losers"][0])
+
+        points[s, rows, first] = BRACKET_POINTS["first"]
+        points[s, rows, second] = BRACKET_POINTS["second"]
+        points[s, rows, third] = BRACKET_POINTS["third"]
+    return points
+
+def _simulate_league(model, n, rng):
+    points = np.repeat(model["fixed_points"][:, None, :], n, axis=1)
+    draw_rate = model["draw_rate"]
+    for s, side1, side2, p in model["remaining"]:
+        u = rng.random(n)
+        draw = u < draw_rate
+        side1_wins = ~draw & (u < draw_rate + (1 - draw_rate) * p)
+        side2_wins = ~draw & ~side1_wins
+        for i in side1:
+            points[s, :, i] += 3 * side1_wins + draw
+        for i in side2:
+            points[s, :, i] += 3 * side2_wins + draw
+    return points
+
+def _first_shares(points):
+    # ties for first place split the win between the tied teams
+    leaders = points == points.max(axis=-1, keepdims=True)
+    return leaders / leaders.sum(axis=-1, keepdims=True)
+
+def _ranks(total):
+    # competition ranking, 0-based: number of teams with strictly more points.
+    # Offsetting each row keeps the rows apart so one searchsorted covers all of them.
+    n, teams = total.shape
+    max_points = int(total.max()) if total.size else 0
+    offsets = np.arange(n)[:, None] * (max_points + 1)
+    ordered = (np.sort(total, axis=1) + offsets).ravel()
+    above = np.searchsorted(ordered, (total + offsets).ravel(), side="right").reshape(n, teams)
+    return (np.arange(1, n + 1)[:, None] * teams - above).astype(int)
+
+def _simulate_chunk(model, n, seed):
+    rng = np.random.default_rng(seed)
+    if model["kind"] == "bracket":
+        sport_points = _simulate_brackets(model, n, rng)
+    else:
+        sport_points = _simulate_league(model, n, rng)
+
+    teams = len(model["names"])
+    total = sport_points.sum(axis=0)
+    max_points = int(total.max()) if total.size else 0
+    ranks = _ranks(total)
+
+    return {
+        "sims": n,
+        "sport_first": _first_shares(sport_points).sum(axis=1),
+        "first": _first_shares(total).sum(axis=0),
+        "ranks": np.stack([np.bincount(ranks[:, t], minlength=teams) for t in range(teams)]),
+        "points": [np.bincount(total[:, t].astype(int), minlength=max_points + 1) for t in range(teams)],
+    }
+
+def _merge(totals, chunk):
+    if totals is None:
+        return chunk
+    totals["sims"] += chunk["sims"]
+    totals["sport_first"] += chunk["sport_first"]
+    totals["first"] += chunk["first"]
+    totals["ranks"] += chunk["ranks"]
+    for t, counts in enumerate(chunk["points"]):
+        size = max(len(counts), len(totals["points"][t]))
+        merged = np.zeros(size, dtype=counts.dtype)
+        merged[:len(counts)] += counts
+        merged[:len(totals["points"][t])] += totals["points"][t]
+        totals["points"][t] = merged
+    return totals
+
+def simulate(model, max_sims=1_000_000, chunk_size=50_000, seed=0, tolerance=0.001, time_budget=None, workers=None):
+    """Play out the remaining matches until the odds converge, the time budget runs out or max_sims is reached.
+
+    Chunks are seeded from one SeedSequence and merged in submission order,
+    with the convergence check after every chunk, so a seed gives the same
+    result on any number of workers. Only a run cut short by time_budget
+    depends on the machine. The budget is checked between chunks and chunks
+    that are already running still finish, so it can overrun by about one
+    chunk per worker.
+    """
+    if max_sims < 1:
+        raise ValueError("max_sims must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed)
+    start = time.perf_counter()
+    totals = None
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        submitted = 0
+        while True:
+            # keep every worker busy, chunks past the stopping point are discarded
+            while len(pending) < workers and submitted < max_sims:
+                size = min(chunk_size, max_sims - submitted)
+                pending.append(pool.submit(_simulate_chunk, model, size, seeds.spawn(1)[0]))
+                submitted += size
+            if not pending:
+                break
+            totals = _merge(totals, pending.popleft().result())
+
+            first = totals["first"] / totals["sims"]
+            error = np.sqrt(first * (1 - first) / totals["sims"]).max()
+            if error < tolerance:
+                break
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                break
+        for future in pending:
+            future.cancel()
+
+    return summarize(model, totals, time.perf_counter() - start)
+
+def summarize(model, totals, elapsed):
+    sims = totals["sims"]
+    names = model["names"]
+    return {
+        "sims": sims,
+        "seconds": elapsed,
+        "first": {name: totals["first"][t] / sims for t, name in enumerate(names)},
+        "sport_first": {
+            sport: {name: totals["sport_first"][s, t] / sims for t, name in enumerate(names)}
+            for s, sport in enumerate(model["sports"])
+        },
+        # placements[name][0] is the chance of finishing first, [1] second, ...
+        # Unlike "first", a tie counts as the shared best rank for every tied
+        # team, so placements[name][0] can be higher than first[name].
+        "placements": {name: totals["ranks"][t] / sims for t, name in enumerate(names)},
+        "points": {name: totals["points"][t] / sims for t, name in enumerate(names)},
+    }
+
+def print_odds(projection):
+    print(f"\n🎲 {projection['sims']:,} simulations in {projection['seconds']:.1f}s")
+    for sport, odds in projection["sport_first"].items():
+        print(f"\n🏟️ {sport}")
+        for name, chance in sorted(odds.items(), key=lambda o: -o[1]):
+            if chance > 0:
+                print(f"  {name:<12} {chance * 100:5.1f}%")
+
+    print("\n🥇 Overall first place")
+    for name, chance in sorted(projection["first"].items(), key=lambda o: -o[1]):
+        expected = (projection["points"][name] * np.arange(len(projection["points"][name]))).sum()
+        print(f"  {name:<12} {chance * 100:5.1f}%  (expected points: {expected:.1f})")
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="🎲 Monte Carlo placement projections")
+    parser.add_argument("--league", action="store_true", help="Project the player league (players.csv) instead of the brackets")
+    parser.add_argument("--sims", type=int, default=1_000_000, help="Maximum number of simulations")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--time-budget", type=float, default=None, help="Stop after this many seconds")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    args = parser.parse_args(argv)
+    if args.sims < 1:
+        parser.error("--sims must be at least 1")
+
+    if args.league:
+        from singles import load_players, load_matches
+        model = build_league_model(load_players(), load_matches())
+    else:
+        from tournament import load_teams, load_matches
+        matches = load_matches()
+        stage_key = "bracket_stage" if matches and "bracket_stage" in matches[0] else "bracket"
+        model = build_bracket_model(load_teams(), matches, stage_key)
+
+    if not model["names"]:
+        print("❌ Nothing to simulate.")
+        return
+
+    projection = simulate(model, max_sims=args.sims, seed=args.seed,
+                          time_budget=args.time_budget, workers=args.workers)
+    print_odds(projection)
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,23 @@
-import csv
 import argparse
-import os
-import subprocess
 from collections import defaultdict
 
+from storage import load_csv, save_csv
+
 def load_players(filename="players.csv"):
-    players = []
-    if not os.path.exists(filename):
-        return players
-    with open(filename) as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            row["points"] = int(row["points"])
-            players.append(row)
-    return players
+    return load_csv(filename, ["points"])
 
 def load_matches(filename="matches.csv"):
-    matches = []
-    if not os.path.exists(filename):
-        return matches
-    with open(filename) as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            row["points1"] = int(row["points1"])
-            row["points2"] = int(row["points2"])
-            matches.append(row)
-    return matches
+    return load_csv(filename, ["points1", "points2"])
 
 def save_players(players, filename="players.csv"):
-    with open(filename, "w", newline="") as file:
-        writer = csv.DictWriter(file, fieldnames=["name", "color", "points"])
-        writer.writeheader()
-        for p in players:
-            writer.writerow(p)
+    save_csv(players, filename, ["name", "color", "points"])
 
 def save_matches(matches, filename="matches.csv"):
-    with open(filename, "w", newline="") as file:
-        writer = csv.DictWriter(file, fieldnames=[
-            "team1player1", "team1player2",
-            "team2player1", "team2player2",
-            "sport", "status", "points1", "points2"
-        ])
-        writer.writeheader()
-        for m in matches:
-            writer.writerow(m)
+    save_csv(matches, filename, [
+        "team1player1", "team1player2",
+        "team2player1", "team2player2",
+        "sport", "status", "points1", "points2"
+    ])
 
 def add_player(players, name, color):
     players.append({"name": name, "color": color, "points": 0})
@@ -69,16 +43,22 @@ def add_match(matches):
     })
     return matches
 
-def update_match_score(matches):
+def list_unfinished_matches(matches):
     unfinished = [m for m in matches if m["status"] != "Finished"]
     if not unfinished:
         print("✅ No unfinished matches.")
-        return matches
+        return unfinished
 
     for i, m in enumerate(unfinished):
         t1 = f"{m['team1player1']} & {m['team1player2']}"
         t2 = f"{m['team2player1']} & {m['team2player2']}"
         print(f"[{i}] {t1} vs {t2} ({m['sport']})")
+    return unfinished
+
+def update_match_score(matches):
+    unfinished = list_unfinished_matches(matches)
+    if not unfinished:
+        return matches
 
     try:
         idx = int(input("🔢 Choose match to update: "))
@@ -92,16 +72,10 @@ def update_match_score(matches):
     return matches
 
 def update_match_status(matches):
-    unfinished = [m for m in matches if m["status"] != "Finished"]
+    unfinished = list_unfinished_matches(matches)
     if not unfinished:
-        print("✅ All matches finished.")
         return matches
 
-    for i, m in enumerate(unfinished):
-        t1 = f"{m['team1player1']} & {m['team1player2']}"
-        t2 = f"{m['team2player1']} & {m['team2player2']}"
-        print(f"[{i}] {t1} vs {t2} ({m['sport']})")
-
     try:
         idx = int(input("🔢 Choose match to update status: "))
         new_status = input("New status (Scheduled, Ongoing, Finished): ")
@@ -162,14 +136,37 @@ def write_md(players, matches, output_file="index.md"):
             score = f"{m['points1']} - {m['points2']}" if m["status"] == "Finished" else "-"
             f.write(f"| {t1:<21} | {t2:<21} | {m['sport']:<9} | {m['status']:<8} | {score:<9} |\n")
 
-def main():
-    parser = argparse.ArgumentParser(description="🏅 Player Tournament CLI")
+def watch_and_rebuild(players_file="players.csv", matches_file="matches.csv", output_file="index.md"):
+    from watcher import watch_and_render
+
+    def render(data):
+        players = calculate_points(data[players_file], data[matches_file])
+        write_md(players, data[matches_file], output_file)
+
+    return watch_and_render({players_file: load_players, matches_file: load_matches}, render)
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="🏅 Player Tournament CLI")
     parser.add_argument("--add-player", action="store_true", help="Add a new player")
     parser.add_argument("--add-match", action="store_true", help="Add a new match")
     parser.add_argument("--update-score", action="store_true", help="Update match score")
     parser.add_argument("--update-status", action="store_true", help="Update match status")
     parser.add_argument("--rebuild", action="store_true", help="Recalculate and rebuild site")
-    args = parser.parse_args()
+    parser.add_argument("--watch", action="store_true", help="Rebuild the site whenever the CSVs change")
+    parser.add_argument("--list", action="store_true", help="List unfinished matches")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        list_unfinished_matches(load_matches())
+        return
+
+    changes = any([args.add_player, args.add_match, args.update_score, args.update_status, args.rebuild])
+    if not changes:
+        if args.watch:
+            watch_and_rebuild()
+        else:
+            parser.print_help()
+        return
 
     players = load_players()
     matches = load_matches()
@@ -188,16 +185,20 @@ def main():
     if args.update_status:
         matches = update_match_status(matches)
 
-    if any([args.add_player, args.add_match, args.update_score, args.update_status, args.rebuild]):
-        players = calculate_points(players, matches)
-        save_players(players)
-        save_matches(matches)
-        write_md(players, matches)
+    players = calculate_points(players, matches)
+    save_players(players)
+    save_matches(matches)
+    write_md(players, matches)
 
     if args.rebuild:
+        import subprocess
+
         subprocess.run(["git", "add", "."], check=True)
         subprocess.run(["git", "commit", "-m", "🔄 Tournament update"], check=True)
         subprocess.run(["git", "push"], check=True)
 
+    if args.watch:
+        watch_and_rebuild()
+
 if __name__ == "__main__":
     main()
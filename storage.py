@@ -0,0 +1,22 @@
+import csv
+import os
+
+
+def load_csv(filename, int_fields=()):
+    rows = []
+    if not os.path.exists(filename):
+        return rows
+    with open(filename) as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            for field in int_fields:
+                row[field] = int(row[field])
+            rows.append(row)
+    return rows
+
+def save_csv(rows, filename, fieldnames):
+    with open(filename, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
@@ -0,0 +1,63 @@
+import pytest
+
+import archive
+
+
+TEAMS = [
+    {"color": "red", "name": "A", "points": 99},  # stale points, re-scored from the matches
+    {"color": "blue", "name": "B", "points": 0},
+    {"color": "lime", "name": "C", "points": 0},
+    {"color": "navy", "name": "D", "points": 0},
+]
+
+def match(team1, team2, bracket, points1, points2, status="Finished"):
+    return {"team1": team1, "team2": team2, "sport": "Football", "status": status,
+            "bracket": bracket, "points1": points1, "points2": points2}
+
+MATCHES = [
+    match("A", "B", "Semis", 3, 1),
+    match("C", "D", "Semis", 0, 2),
+    match("A", "D", "Finals", 2, 1),
+    match("B", "C", "Losers", 1, 1),  # a draw goes to team2 like in set_points
+]
+
+def test_freeze_rows_round_trip(tmp_path):
+    filename = tmp_path / "season.arc"
+    archive.freeze(filename, TEAMS, MATCHES)
+
+    with archive.Archive(filename) as frozen:
+        assert frozen.rows("teams") == TEAMS
+        assert frozen.rows("matches") == MATCHES
+        with frozen.column("matches", "points1") as points1:
+            assert points1.tolist() == [3, 0, 2, 1]
+
+def test_freeze_refuses_unfinished_matches(tmp_path):
+    with pytest.raises(ValueError):
+        archive.freeze(tmp_path / "season.arc", TEAMS, MATCHES + [match("A", "C", "Semis", 0, 0, "Scheduled")])
+
+@pytest.mark.parametrize("value", ["x", 2**40])
+def test_freeze_rejects_bad_points(tmp_path, value):
+    with pytest.raises(ValueError):
+        archive.freeze(tmp_path / "season.arc", TEAMS, [match("A", "B", "Semis", value, 1)])
+
+@pytest.mark.parametrize("content", [b"", b"TARC", b"not an archive at all"])
+def test_bad_files_raise_value_error(tmp_path, content):
+    filename = tmp_path / "broken.arc"
+    filename.write_bytes(content)
+    with pytest.raises(ValueError):
+        archive.Archive(filename)
+
+def test_truncated_archive_raises_value_error(tmp_path):
+    filename = tmp_path / "season.arc"
+    archive.freeze(filename, TEAMS, MATCHES)
+    filename.write_bytes(filename.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        archive.Archive(filename)
+
+def test_season_stats_are_scored_from_the_matches(tmp_path):
+    first, second = tmp_path / "first.arc", tmp_path / "second.arc"
+    archive.freeze(first, TEAMS, MATCHES)
+    archive.freeze(second, TEAMS, MATCHES)
+
+    assert archive.season_standings([first, second]) == {"A": 6, "D": 4, "C": 2, "B": 0}
+    assert archive.win_counts([first, second]) == {"A": 4, "D": 2, "C": 2}
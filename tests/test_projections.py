@@ -0,0 +1,37 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import projections
+
+
+def league_model():
+    players = [{"name": name, "points": 0} for name in "WXYZ"]
+    matches = [
+        {"team1player1": "W", "team1player2": "X", "team2player1": "Y", "team2player2": "Z",
+         "sport": "Tennis", "status": "Finished", "points1": 2, "points2": 1},
+        {"team1player1": "W", "team1player2": "Y", "team2player1": "X", "team2player2": "Z",
+         "sport": "Tennis", "status": "Scheduled", "points1": 0, "points2": 0},
+        {"team1player1": "W", "team1player2": "Z", "team2player1": "X", "team2player2": "Y",
+         "sport": "Darts", "status": "Scheduled", "points1": 0, "points2": 0},
+    ]
+    return projections.build_league_model(players, matches)
+
+def test_ranks_match_brute_force():
+    rng = np.random.default_rng(0)
+    total = rng.integers(0, 6, size=(200, 5)).astype(float)
+    brute_force = (total[:, None, :] > total[:, :, None]).sum(axis=2)
+    assert (projections._ranks(total) == brute_force).all()
+
+def test_simulate_is_reproducible_across_worker_counts():
+    model = league_model()
+    one = projections.simulate(model, max_sims=60_000, chunk_size=10_000, seed=1, tolerance=0, workers=1)
+    three = projections.simulate(model, max_sims=60_000, chunk_size=10_000, seed=1, tolerance=0, workers=3)
+    assert one["sims"] == three["sims"] == 60_000
+    assert one["first"] == three["first"]
+    for name in model["names"]:
+        assert (one["placements"][name] == three["placements"][name]).all()
+
+def test_simulate_rejects_zero_sims():
+    with pytest.raises(ValueError):
+        projections.simulate(league_model(), max_sims=0)
@@ -0,0 +1,45 @@
+import threading
+import time
+
+from watcher import snapshot, wait_until_settled, watch_and_render
+
+
+def test_wait_until_settled_waits_for_the_last_write(tmp_path):
+    data = tmp_path / "matches.csv"
+    data.write_text("a")
+    files = [str(data)]
+
+    def burst():
+        for i in range(3):
+            time.sleep(0.02)
+            data.write_text("a" * (i + 2))
+
+    writer = threading.Thread(target=burst)
+    writer.start()
+    settled = wait_until_settled(files, snapshot(files), debounce=0.1)
+    writer.join()
+
+    assert settled == snapshot(files)
+    assert data.read_text() == "aaaa"
+
+def test_watch_and_render_renders_up_front_and_after_changes(tmp_path):
+    data = tmp_path / "matches.csv"
+    data.write_text("1")
+    rendered = []
+
+    def render(loaded):
+        rendered.append(loaded[str(data)])
+        if len(rendered) == 2:
+            raise KeyboardInterrupt
+
+    def edit():
+        time.sleep(0.1)
+        data.write_text("22")
+
+    writer = threading.Thread(target=edit)
+    writer.start()
+    latencies = watch_and_render({str(data): lambda f: open(f).read()}, render, interval=0.05, debounce=0.05)
+    writer.join()
+
+    assert rendered == ["1", "22"]
+    assert latencies == []
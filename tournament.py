@@ -1,33 +1,17 @@
-import csv
 import argparse
-import os
-import subprocess
 from collections import defaultdict
 
+from storage import load_csv, save_csv
+
 
 #teams: list of teams = {color, name, points}
 #matches: list of matches = {team1, team2, sport, status, points1, points2}
 
 def load_teams(filename="teams.csv"):
-    teams = []
-    with open(filename) as teams_file:
-        reader = csv.DictReader(teams_file)
-        for row in reader:
-            teams.append(row)
-    for team in teams:
-        team["points"] = int(team["points"])
-    return teams
+    return load_csv(filename, ["points"])
 
 def load_matches(filename="matches.csv"):
-    matches = []
-    with open(filename) as matches_file:
-        reader = csv.DictReader(matches_file)
-        for row in reader:
-            matches.append(row)
-    for match in matches:
-        match["points1"] = int(match["points1"])
-        match["points2"] = int(match["points2"])
-    return matches
+    return load_csv(filename, ["points1", "points2"])
 
 def get_team_index(teams, name):
     for i in range(len(teams)):
@@ -83,20 +67,10 @@ def add_match(matches, team1, team2, sport, status, bracket, points1=0, points2=
     return matches
 
 def save_teams_to_csv(teams, filename="teams.csv"):
-    with open(filename, "w", newline="") as file:
-        fieldnames = ["color", "name", "points"]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        for team in teams:
-            writer.writerow(team)
+    save_csv(teams, filename, ["color", "name", "points"])
 
 def save_matches_to_csv(matches, filename="matches.csv"):
-    with open(filename, "w", newline="") as file:
-        fieldnames = ["team1", "team2", "sport", "status", "bracket", "points1", "points2"]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        for match in matches:
-            writer.writerow(match)
+    save_csv(matches, filename, ["team1", "team2", "sport", "status", "bracket", "points1", "points2"])
 
 def list_unfinished_matches(matches):
     unfinished = [m for m in matches if m["status"] != "Finished"]
@@ -183,27 +157,42 @@ def write_md(teams, matches, output_file="index.md"):
                 score = "-"
             file.write(f"| {match['team1']} vs {match['team2']} | {match['sport']} | {match['status']} | {score} | {match['bracket']} |\n")
 
-def main():
-    parser = argparse.ArgumentParser(description="🎮 Tournament Manager CLI")
+def watch_and_rebuild(teams_file="teams.csv", matches_file="matches.csv", output_file="index.md"):
+    from watcher import watch_and_render
+
+    def render(data):
+        teams = set_points(data[teams_file], data[matches_file])
+        write_md(teams, data[matches_file], output_file)
+
+    return watch_and_render({teams_file: load_teams, matches_file: load_matches}, render)
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="🎮 Tournament Manager CLI")
 
     parser.add_argument("--add-team", action="store_true", help="Add a new team")
     parser.add_argument("--add-match", action="store_true", help="Add a new match")
     parser.add_argument("--update-score", action="store_true", help="Update match score")
     parser.add_argument("--update-status", action="store_true", help="Update match status")
     parser.add_argument("--rebuild", action="store_true", help="Recalculate points and rebuild the site")
+    parser.add_argument("--watch", action="store_true", help="Rebuild the site whenever the CSVs change")
+    parser.add_argument("--list", action="store_true", help="List unfinished matches")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    # Handle missing CSVs gracefully
-    if not os.path.exists("teams.csv"):
-        print("📁 Creating empty teams.csv...")
-        save_teams_to_csv([])
+    if args.list:
+        # read-only, so teams.csv is not needed
+        list_unfinished_matches(load_matches())
+        return
 
-    if not os.path.exists("matches.csv"):
-        print("📁 Creating empty matches.csv...")
-        save_matches_to_csv([])
+    changes = any([args.add_team, args.add_match, args.update_score, args.update_status, args.rebuild])
+    if not changes:
+        if args.watch:
+            watch_and_rebuild()
+        else:
+            parser.print_help()
+        return
 
-    # Load data
+    # Missing CSVs load as empty and get created on save
     teams = load_teams()
     matches = load_matches()
 
@@ -213,8 +202,8 @@ def main():
         teams = add_team(teams, name, color)
 
     elif args.add_match:
-        team1 = input(f"Team 1({[t["name"] for t in teams]}): ")
-        team2 = input(f"Team 2({[t["name"] for t in teams]}): ")
+        team1 = input(f"Team 1({[t['name'] for t in teams]}): ")
+        team2 = input(f"Team 2({[t['name'] for t in teams]}): ")
         sport = input("Sport: ")
         bracket = input("Bracket (Semis, Finals or Losers): ")
         status = "Scheuduled"
@@ -226,18 +215,22 @@ def main():
     elif args.update_status:
         matches = update_match_status(matches)
 
-    # Rebuild site or if anything changed
-    if any([args.add_team, args.add_match, args.update_score, args.update_status, args.rebuild]):
-        teams = set_points(teams, matches)
-        save_teams_to_csv(teams)
-        save_matches_to_csv(matches)
-        write_md(teams, matches)
+    # Every action above changes the data, so rescore and rebuild the site
+    teams = set_points(teams, matches)
+    save_teams_to_csv(teams)
+    save_matches_to_csv(matches)
+    write_md(teams, matches)
 
     if args.rebuild:
+        import subprocess
+
         # Optional: Auto-push to GitHub Pages
         subprocess.run(["git", "add", "."], check=True)
         subprocess.run(["git", "commit", "-m", "🔄 automatic Tournament update"], check=True)
         subprocess.run(["git", "push"], check=True)
 
+    if args.watch:
+        watch_and_rebuild()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,88 @@
+import os
+import time
+
+
+def file_signature(filename):
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def snapshot(filenames):
+    return {filename: file_signature(filename) for filename in filenames}
+
+def wait_until_settled(filenames, current, debounce=0.3):
+    # a burst of saves keeps resetting the timer until the files stop changing
+    while True:
+        time.sleep(debounce)
+        settled = snapshot(filenames)
+        if settled == current:
+            return settled
+        current = settled
+
+def watch(filenames, on_change, interval=0.5, debounce=0.3):
+    """Poll the given files and call on_change(changed_files) after each burst of edits.
+
+    Returns the list of end-to-end latencies (seconds from the newest file
+    modification to the finished rebuild) once the user stops with Ctrl+C.
+    """
+    seen = snapshot(filenames)
+    latencies = []
+    print(f"👀 Watching {', '.join(filenames)} (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot(filenames)
+            if current == seen:
+                continue
+
+            current = wait_until_settled(filenames, current, debounce)
+            changed = [f for f in filenames if current[f] != seen[f]]
+            if not changed:
+                continue
+
+            # edits made while rebuilding still differ from this and trigger the next one
+            seen = current
+            try:
+                on_change(changed)
+            except Exception as e:
+                # half-written CSVs are common while editing, keep watching
+                print("❌ Error:", e)
+                continue
+
+            modified = [current[f][0] for f in changed if current[f] is not None]
+            if modified:
+                latency = time.time() - max(modified) / 1e9
+                latencies.append(latency)
+                print(f"🔄 Rebuilt after changes in {', '.join(changed)} ({latency * 1000:.0f} ms)")
+            else:
+                print(f"🔄 Rebuilt after {', '.join(changed)} was removed")
+    except KeyboardInterrupt:
+        if latencies:
+            average = sum(latencies) / len(latencies)
+            print(f"\n⏱️ {len(latencies)} rebuilds, avg {average * 1000:.0f} ms, max {max(latencies) * 1000:.0f} ms")
+        print("👋 Stopped watching.")
+
+    return latencies
+
+def watch_and_render(loaders, render, interval=0.5, debounce=0.3):
+    """Keep the CSVs of loaders ({filename: loader}) loaded and call render(data) after each burst of edits.
+
+    Renders once up front too, the CSVs may have changed while nobody was watching.
+    """
+    data = {}
+
+    def rebuild(changed):
+        # only reparse the CSVs that were actually edited
+        for filename in changed:
+            data[filename] = loaders[filename](filename)
+        render(data)
+
+    try:
+        rebuild(list(loaders))
+    except Exception as e:
+        print("❌ Error:", e)
+
+    return watch(list(loaders), rebuild, interval, debounce)